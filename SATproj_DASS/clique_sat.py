@@ -1,9 +1,26 @@
+import os
+import re
 import subprocess
 from argparse import ArgumentParser
+from array import array
+from itertools import chain, compress, count, repeat
 
 N_VERTICES = 0
 EDGES = []
-ADJ = {}
+ADJ = []
+ADJ_BITS = []
+NON_EDGE_CLAUSES = array("i")
+
+# bytes.translate table mapping the characters b"0"/b"1" to the bytes 0/1
+_BIT_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+# write_cnf_to_file: file buffer size and number of literals formatted per write
+_WRITE_BUFFER = 1 << 20
+_WRITE_CHUNK = 1 << 16
+
+# parse_model: body of each solver 'v' (value) line, and the literals in it
+_VALUE_LINE_RE = re.compile(rb"^[ \t]*v(?=\s)([^\n]*)", re.MULTILINE)
+_LITERAL_RE = re.compile(rb"(?<!\S)-?\d+(?!\S)")
 
 
 def load_instance(input_file_name):
@@ -16,132 +33,228 @@ def load_instance(input_file_name):
         e u v
         ...
 
-    Sets global N_VERTICES, EDGES, ADJ.
+    Sets global N_VERTICES, EDGES, ADJ, ADJ_BITS, NON_EDGE_CLAUSES.
+    ADJ_BITS[u] is an int bitset of the neighbours of u: bit v is set
+    iff {u, v} is an edge (vertex ids are 1-based, bit 0 is unused), so
+    "is {u, v} an edge" is the bit test ADJ_BITS[u] >> v & 1.
+    ADJ[u] is the sorted tuple of the neighbours of u (ADJ[0] is empty),
+    for code that walks neighbourhoods.
+    NON_EDGE_CLAUSES holds the clique clauses [-u, -v, 0] of every non-edge
+    in the flat literal format of encode_k_clique; they do not depend on k,
+    so they are built once here and reused for every k.
     """
-    global N_VERTICES, EDGES, ADJ
+    global N_VERTICES, EDGES, ADJ, ADJ_BITS, NON_EDGE_CLAUSES
 
     N_VERTICES = None
     EDGES = []
 
+    # Single streaming pass: the header and the edge lines are handled as
+    # they are read, without keeping the lines of the file in memory.
     with open(input_file_name, "r") as f:
-        raw_lines = [line.strip() for line in f]
-
-    for line in raw_lines:
-        if not line or line.startswith("c"):
-            continue
-
-        tokens = line.split()
-        if tokens[0] == "p":
-            if len(tokens) < 4 or tokens[1] != "edge":
-                raise ValueError("Only DIMACS 'p edge <num_vertices> <num_edges>' format is supported.")
-            try:
-                N_VERTICES = int(tokens[2])
-            except ValueError as e:
-                raise ValueError("Invalid number of vertices in 'p' line.") from e
-            break
+        for line in f:
+            tokens = line.split()
+            if not tokens:
+                continue
 
-    if N_VERTICES is None:
-        raise ValueError("No valid 'p edge' header line found in the input file.")
+            tag = tokens[0]
 
-    for line in raw_lines:
-        if not line or line.startswith("c"):
-            continue
+            if tag == "e":
+                if len(tokens) < 3:
+                    raise ValueError(f"Malformed edge line: {line.strip()!r}")
+                try:
+                    u = int(tokens[1])
+                    v = int(tokens[2])
+                except ValueError as e:
+                    raise ValueError(f"Non-integer vertex id in edge line: {line.strip()!r}") from e
 
-        tokens = line.split()
-        tag = tokens[0]
+                if u == v:
+                    continue
 
-        if tag == "e":
-            if len(tokens) < 3:
-                raise ValueError(f"Malformed edge line: {line!r}")
-            try:
-                u = int(tokens[1])
-                v = int(tokens[2])
-            except ValueError as e:
-                raise ValueError(f"Non-integer vertex id in edge line: {line!r}") from e
+                if u > v:
+                    u, v = v, u
 
-            if u == v:
-                continue
+                EDGES.append((u, v))
 
-            if u > v:
-                u, v = v, u
+            elif tag == "p" and N_VERTICES is None:
+                if len(tokens) < 4 or tokens[1] != "edge":
+                    raise ValueError("Only DIMACS 'p edge <num_vertices> <num_edges>' format is supported.")
+                try:
+                    N_VERTICES = int(tokens[2])
+                except ValueError as e:
+                    raise ValueError("Invalid number of vertices in 'p' line.") from e
 
-            EDGES.append((u, v))
+    if N_VERTICES is None:
+        raise ValueError("No valid 'p edge' header line found in the input file.")
 
-    ADJ = {vertex: set() for vertex in range(1, N_VERTICES + 1)}
+    ADJ_BITS = [0] * (N_VERTICES + 1)
     for u, v in EDGES:
-        ADJ[u].add(v)
-        ADJ[v].add(u)
+        # Checked here, as edge lines may come before the 'p' line; u < v.
+        if u < 1 or v > N_VERTICES:
+            raise ValueError(f"Vertex id out of range 1..{N_VERTICES} in edge line: 'e {u} {v}'")
+        ADJ_BITS[u] |= 1 << v
+        ADJ_BITS[v] |= 1 << u
+
+    # Read the sorted neighbour lists straight off the bitsets; duplicate
+    # edge lines collapse there, so no per-vertex hash sets are needed.
+    ADJ = [tuple(_iter_bits(bits)) for bits in ADJ_BITS]
+
+    # Non-edges {u, v} with u < v: bits u+1..N of the complemented
+    # adjacency bitset of u.
+    NON_EDGE_CLAUSES = array("i")
+    all_bits = (1 << (N_VERTICES + 1)) - 1
+    for u in range(1, N_VERTICES + 1):
+        non_neighbours = _iter_bits(~ADJ_BITS[u] & all_bits & ~((1 << (u + 1)) - 1))
+        _emit_clauses(NON_EDGE_CLAUSES, repeat(-u), map(int.__neg__, non_neighbours))
 
     return (N_VERTICES, EDGES)
 
 
-def at_var_id(v, p, k):
+def greedy_clique():
+    """
+    Build a clique greedily in the global graph (N_VERTICES, ADJ_BITS):
+    repeatedly add the candidate with the most neighbours among the remaining
+    candidates, then keep only its neighbours as candidates.
+
+    Returns the clique as a sorted list of vertices; its size is a lower
+    bound on the maximum clique size.
     """
-    Encode At(v, p): vertex v is at clique position p (0..k-1)
-    as a SAT variable id in 1..(N_VERTICES * k).
+    clique = []
+    candidates = ((1 << (N_VERTICES + 1)) - 1) & ~1
 
-    We conceptually think of a k x N_VERTICES table of variables:
+    while candidates:
+        best = max(_iter_bits(candidates), key=lambda v: bin(ADJ_BITS[v] & candidates).count("1"))
+        clique.append(best)
+        candidates &= ADJ_BITS[best]
 
-        row p (0-based)  -> clique position
-        column v (1-based) -> vertex id
+    return sorted(clique)
 
-    Variables are numbered row by row, starting from 1.
+
+def degeneracy():
+    """
+    Return the degeneracy of the global graph (N_VERTICES, ADJ): the largest
+    minimum degree seen while repeatedly deleting a vertex of minimum degree.
+
+    Every clique of size c needs c - 1 neighbours per vertex in the
+    remaining graph, so degeneracy() + 1 is an upper bound on the maximum
+    clique size.
+    """
+    degree = [0] * (N_VERTICES + 1)
+    for v in range(1, N_VERTICES + 1):
+        degree[v] = len(ADJ[v])
+
+    buckets = [set() for _ in range(max(degree) + 1)]
+    for v in range(1, N_VERTICES + 1):
+        buckets[degree[v]].add(v)
+
+    removed = bytearray(N_VERTICES + 1)
+    core = 0
+    low = 0
+    for _ in range(N_VERTICES):
+        while not buckets[low]:
+            low += 1
+        v = buckets[low].pop()
+        removed[v] = 1
+        core = max(core, low)
+        for u in ADJ[v]:
+            if not removed[u]:
+                buckets[degree[u]].remove(u)
+                degree[u] -= 1
+                buckets[degree[u]].add(u)
+        # Deleting v lowers its neighbours' degrees by at most one.
+        low = max(low - 1, 0)
+
+    return core
+
+
+def _iter_bits(mask):
     """
-    if not (0 <= p < k):
-        raise ValueError(f"Position p={p} is out of range [0, {k-1}].")
-    if not (1 <= v <= N_VERTICES):
-        raise ValueError(f"Vertex v={v} is out of range [1, {N_VERTICES}].")
+    Iterate over the positions of the set bits of a non-negative int,
+    in increasing order.
 
-    row_offset = p * N_VERTICES
-    var_id = row_offset + v
+    The bits are expanded by format()/translate() and picked by compress(),
+    so the scan runs in C rather than one Python step per bit.
+    """
+    flags = format(mask, "b")[::-1].encode("ascii").translate(_BIT_FLAGS)
+    return compress(count(), flags)
 
-    return var_id
+
+def _emit_clauses(cnf, *literal_columns):
+    """
+    Append the clauses [a, b, ..., 0] for (a, b, ...) in zip(*literal_columns)
+    to the flat literal array 'cnf'.
+
+    The interleaving runs entirely inside zip/chain and array.extend,
+    so no Python bytecode is executed per clause.
+    """
+    cnf.extend(chain.from_iterable(zip(*literal_columns, repeat(0))))
+
+
+def _emit_at_least(cnf, lits, bound, first_aux):
+    """
+    Append a sequential-counter encoding of "at least 'bound' of 'lits' are
+    true" to the flat literal array 'cnf'.
+
+    Uses len(lits) * bound auxiliary variables r(i, j), numbered row by row
+    from first_aux, where r(i, j) (1 <= i <= n, 1 <= j <= bound) implies
+    "at least j of lits[0..i-1] are true":
+
+        r(1, 1) -> x_1                     r(1, j) -> false        (j > 1)
+        r(i, j) -> r(i-1, j) v x_i
+        r(i, j) -> r(i-1, j) v r(i-1, j-1)                         (j > 1)
+
+    together with the unit clause r(n, bound): about 2 * n * bound clauses.
+    """
+    n = len(lits)
+    if bound < 1:
+        return
+    if n == 0:
+        cnf.append(0)
+        return
+
+    rows = [range(first_aux + i * bound, first_aux + (i + 1) * bound) for i in range(n)]
+    neg_rows = [range(-row.start, -row.stop, -1) for row in rows]
+
+    cnf.extend((neg_rows[0][0], lits[0], 0))
+    _emit_clauses(cnf, neg_rows[0][1:])
+
+    for i in range(1, n):
+        row, prev = neg_rows[i], rows[i - 1]
+        _emit_clauses(cnf, row, prev, repeat(lits[i], bound))
+        _emit_clauses(cnf, row[1:], prev[1:], prev)
+
+    cnf.extend((rows[-1][-1], 0))
 
 
 def encode_k_clique(k):
     """
-    Encode 'there exists a clique of size EXACTLY k'
-    in the global graph (N_VERTICES, ADJ).
+    Encode 'there exists a clique of size AT LEAST k' (equivalently: of size
+    exactly k, since any k vertices of a larger clique form a clique)
+    in the global graph (N_VERTICES, ADJ_BITS).
 
-    Variables: At(v,p) for v in {1..N_VERTICES}, p in {0..k-1}.
+    Variables: x_v = "vertex v is in the clique", with id v in
+    1..N_VERTICES, followed by the N_VERTICES * k auxiliary variables of
+    the "at least k of x_1..x_N" counter (see _emit_at_least).
+
+    Constraints:
+        (-x_u v -x_v)                for every non-edge {u, v}
+        at least k of x_1..x_N
 
     Returns:
         (cnf, nr_vars)
     where:
-        cnf     = list of clauses, each clause is a list of ints ending with 0
+        cnf     = flat array('i') of literals in DIMACS order, every clause
+                  terminated by 0 (about 4 bytes per literal instead of a
+                  Python list per clause)
         nr_vars = total number of SAT variables
     """
-    cnf = []
+    # The clique clauses are the same for every k (see load_instance);
+    # copying the cached array is a single memcpy.
+    cnf = array("i", NON_EDGE_CLAUSES)
     vertices = list(range(1, N_VERTICES + 1))
 
-    def all_pairs(items):
-        """Yield all ordered pairs (i, j) with i < j from a sequence."""
-        n = len(items)
-        for idx in range(n):
-            for jdx in range(idx + 1, n):
-                yield items[idx], items[jdx]
-
-    for p in range(k):
-        clause = [at_var_id(v, p, k) for v in vertices]
-        clause.append(0)
-        cnf.append(clause)
-
-    for p in range(k):
-        for u, v in all_pairs(vertices):
-            cnf.append([-at_var_id(u, p, k), -at_var_id(v, p, k), 0])
-
-    positions = list(range(k))
-    for v in vertices:
-        for p1, p2 in all_pairs(positions):
-            cnf.append([-at_var_id(v, p1, k), -at_var_id(v, p2, k), 0])
-
-    for u, v in all_pairs(vertices):
-        if v not in ADJ[u]:
-            for p1, p2 in all_pairs(positions):
-                cnf.append([-at_var_id(u, p1, k), -at_var_id(v, p2, k), 0])
-                cnf.append([-at_var_id(v, p1, k), -at_var_id(u, p2, k), 0])
-
-    nr_vars = N_VERTICES * k
+    _emit_at_least(cnf, vertices, k, N_VERTICES + 1)
+
+    nr_vars = N_VERTICES + N_VERTICES * max(k, 0)
     return cnf, nr_vars
 
 
@@ -153,23 +266,46 @@ def write_cnf_to_file(cnf, nr_vars, output_name):
         p cnf <nr_vars> <nr_clauses>
         <lit1> <lit2> ... 0
         ...
+
+    'cnf' is the flat 0-terminated literal array built by encode_k_clique.
+    The literals are formatted in chunks of about _WRITE_CHUNK literals
+    (cut at a clause boundary) and streamed through a 1 MiB write buffer,
+    so the full text of the formula is never held in memory. Each chunk is
+    formatted by a single bytes % operation, without a str() per literal.
     """
-    nr_clauses = len(cnf)
-    lines = []
+    nr_clauses = cnf.count(0)
     header = " ".join(["p", "cnf", str(nr_vars), str(nr_clauses)])
-    lines.append(header + "\n")
-    for clause in cnf:
-        literal_strings = [str(lit) for lit in clause]
-        lines.append(" ".join(literal_strings) + "\n")
-    with open(output_name, "w") as f:
-        f.writelines(lines)
-
-
-def call_solver(output_name, solver_name, verbosity):
+    total = len(cnf)
+    with open(output_name, "wb", buffering=_WRITE_BUFFER) as f:
+        f.write(header.encode("ascii") + b"\n")
+        start = 0
+        while start < total:
+            if cnf[start] == 0:
+                # An empty clause has no literal before its 0, so the replace
+                # below would miss it. encode_k_clique only emits one for a
+                # graph without vertices, where it is the whole formula.
+                f.write(b"0\n")
+                start += 1
+                continue
+            # Extend the chunk to the end of the clause it cuts into. Clauses
+            # are short, so this walks only a few literals (array.index only
+            # takes a start argument from Python 3.10 on).
+            end = min(start + _WRITE_CHUNK, total)
+            while cnf[end - 1] != 0:
+                end += 1
+            # The only "0" tokens are clause terminators, so each " 0 " ends
+            # a line (including the last one, as every literal gets a space).
+            text = (b"%d " * (end - start)) % tuple(cnf[start:end])
+            f.write(text.replace(b" 0 ", b" 0\n"))
+            start = end
+
+
+def start_solver(output_name, solver_name, verbosity):
     """
-    Call Glucose (or another SAT solver) on the DIMACS CNF formula.
+    Launch Glucose (or another SAT solver) on the DIMACS CNF formula
+    without waiting for it to finish.
 
-    Returns the CompletedProcess object.
+    Returns the Popen object; pass it to wait_solver() to get the result.
     """
     if solver_name.startswith("./"):
         solver_cmd = solver_name
@@ -183,7 +319,26 @@ def call_solver(output_name, solver_name, verbosity):
         output_name,
     ]
 
-    return subprocess.run(cmd, stdout=subprocess.PIPE)
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE)
+
+
+def wait_solver(proc):
+    """
+    Wait for a solver started by start_solver() and collect its output.
+
+    Returns a CompletedProcess object, like subprocess.run would.
+    """
+    stdout, _ = proc.communicate()
+    return subprocess.CompletedProcess(proc.args, proc.returncode, stdout)
+
+
+def call_solver(output_name, solver_name, verbosity):
+    """
+    Call Glucose (or another SAT solver) on the DIMACS CNF formula.
+
+    Returns the CompletedProcess object.
+    """
+    return wait_solver(start_solver(output_name, solver_name, verbosity))
 
 
 def parse_model(result):
@@ -195,35 +350,28 @@ def parse_model(result):
     if result.returncode == 20:
         return None
 
-    raw_output = result.stdout.decode("utf-8")
-    model_literals = []
-
-    for line in raw_output.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if stripped[0] != "v":
-            continue
-
-        tokens = stripped.split()
-        for t in tokens[1:]:
-            try:
-                lit = int(t)
-            except ValueError:
-                continue
-            model_literals.append(lit)
-
-    model = [lit for lit in model_literals if lit != 0]
+    # Pull the integer tokens of all 'v' lines straight out of the raw bytes
+    # with compiled regexes instead of splitting and stripping line by line.
+    value_lines = b" ".join(_VALUE_LINE_RE.findall(result.stdout))
+    model = [lit for lit in map(int, _LITERAL_RE.findall(value_lines)) if lit != 0]
 
     return model
 
 
-def extract_stats(result):
+def solver_output_lines(result):
+    """
+    Decode the solver output once and split it into lines, so that the raw
+    output printer and extract_stats can share the same list.
+    """
+    return result.stdout.decode("utf-8").splitlines()
+
+
+def extract_stats(lines):
     """
-    Extract selected statistics lines from Glucose output.
+    Extract selected statistics lines from Glucose output, given as the
+    list returned by solver_output_lines().
     Returns a list of lines (strings).
     """
-    output = result.stdout.decode("utf-8")
     keywords = {"conflicts", "decisions", "propagations", "CPU time"}
 
     def is_stats_line(line: str) -> bool:
@@ -232,27 +380,22 @@ def extract_stats(result):
             return False
         return any(key in line for key in keywords)
 
-    return [line.strip() for line in output.splitlines() if is_stats_line(line)]
+    return [line.strip() for line in lines if is_stats_line(line)]
 
 
-def decode_clique(model, k):
+def decode_clique(model):
     """
-    Given a model and clique size k, decode which vertices are in the clique.
-    Uses the fact that model[var_id-1] is the assignment for variable var_id.
-    """
-    clique_vertices = set()
+    Given a model, decode which vertices are in the clique.
+    Uses the fact that model[var_id-1] is the assignment for variable var_id,
+    and that vertex v is variable v (see encode_k_clique).
 
-    for v in range(1, N_VERTICES + 1):
-        in_clique = False
-        for p in range(k):
-            var_id = at_var_id(v, p, k)
-            if model[var_id - 1] > 0:
-                in_clique = True
-                break
-        if in_clique:
-            clique_vertices.add(v)
+    For a model of encode_k_clique(k) the result is a clique of at least
+    k vertices; it may be larger.
+    """
+    is_true = map((0).__lt__, model[:N_VERTICES])
+    clique_vertices = list(compress(range(1, N_VERTICES + 1), is_true))
 
-    return sorted(clique_vertices)
+    return clique_vertices
 
 
 def solve_for_fixed_k(k, output_name, solver_name, verbosity, dump_only=False):
@@ -269,14 +412,14 @@ def solve_for_fixed_k(k, output_name, solver_name, verbosity, dump_only=False):
 
     result = call_solver(output_name, solver_name, verbosity)
 
-    def print_raw_output(proc_result):
+    def print_raw_output(lines):
         print("========== Solver raw output ==========")
-        text = proc_result.stdout.decode("utf-8")
-        for line in text.splitlines():
+        for line in lines:
             print(line)
         print("=======================================\n")
 
-    print_raw_output(result)
+    output_lines = solver_output_lines(result)
+    print_raw_output(output_lines)
 
     rc = result.returncode
 
@@ -289,7 +432,8 @@ def solve_for_fixed_k(k, output_name, solver_name, verbosity, dump_only=False):
         return
 
     model = parse_model(result)
-    clique_vertices = decode_clique(model, k)
+    # The model may select a larger clique; any k of its vertices form one.
+    clique_vertices = decode_clique(model)[:k]
 
     print("##################################################################")
     print("###########[ Human readable result of the clique problem ]########")
@@ -299,7 +443,7 @@ def solve_for_fixed_k(k, output_name, solver_name, verbosity, dump_only=False):
     print("Vertices in the clique:", clique_vertices)
     print()
 
-    stats_lines = extract_stats(result)
+    stats_lines = extract_stats(output_lines)
     if stats_lines:
         print("---------- Solver statistics (from Glucose) ----------")
         for line in stats_lines:
@@ -309,66 +453,140 @@ def solve_for_fixed_k(k, output_name, solver_name, verbosity, dump_only=False):
 
 def solve_max_clique(output_name, solver_name, verbosity, dump_only=False):
     """
-    Incrementally search for the maximum clique size by testing k = 1, 2, ...
-    For each k, encode and write a CNF instance and (unless dump_only=True)
-    invoke the SAT solver. Stops when the first UNSAT result is encountered.
-
-    NOTE: with dump_only=True this will only keep the CNF for the last k
-    (since the same output file is reused each time).
+    Search for the maximum clique size by binary search on k.
+
+    Having a clique of size k implies having one of every smaller size, so
+    the SAT answers are monotone in k. The search keeps
+        lo = largest k known to be SAT
+        hi = largest k not yet ruled out
+    and probes mid = (lo + hi + 1) // 2 until lo == hi, which takes about
+    log2(hi - lo) solver calls. It starts from lo = size of greedy_clique()
+    and hi = degeneracy() + 1, so no solver call is spent on sizes that
+    cheap graph bounds already settle.
+
+    Each probe is still a fresh solver run on its own CNF file: Glucose is
+    driven through DIMACS files, so learned clauses cannot be carried over.
+
+    While the solver works on k, both possible follow-up probes are encoded:
+    the one after a SAT answer into '<output_name>.next' and the one after
+    an UNSAT answer into '<output_name>.next-unsat'. Whichever is probed next
+    is renamed to output_name, so encoding overlaps with solving; the other
+    is discarded.
+
+    NOTE: with dump_only=True no solver answers are available, so the CNF is
+    written for k = 1, 2, ..., N_VERTICES in turn and only the last one is
+    kept (since the same output file is reused each time).
     """
-    best_k = 0
-    best_clique = []
-
     def print_banner(k_value):
         print("====================================================")
         print(f"Trying clique size k = {k_value}")
         print("====================================================")
 
-    def show_raw_output(proc_result):
+    def show_raw_output(lines):
         print("========== Solver raw output ==========")
-        text = proc_result.stdout.decode("utf-8")
-        for ln in text.splitlines():
+        for ln in lines:
             print(ln)
         print("=======================================\n")
 
-    for k in range(1, N_VERTICES + 1):
-        print_banner(k)
-
-        cnf, nr_vars = encode_k_clique(k)
-        write_cnf_to_file(cnf, nr_vars, output_name)
-
-        if dump_only:
+    if dump_only:
+        for k in range(1, N_VERTICES + 1):
+            print_banner(k)
+            cnf, nr_vars = encode_k_clique(k)
+            write_cnf_to_file(cnf, nr_vars, output_name)
             print(f"(dump-only) CNF for k={k} written to {output_name}")
-            continue
-
-        result = call_solver(output_name, solver_name, verbosity)
-        show_raw_output(result)
-
-        rc = result.returncode
-
-        if rc == 20:
-            print(f"No clique of size {k}. Maximum clique size is {best_k}.")
-            break
-
-        if rc != 10:
-            print(f"Solver returned unexpected code: {rc}")
-            break
+        return
 
-        model = parse_model(result)
-        clique_vertices = decode_clique(model, k)
+    best_clique = greedy_clique()
+    best_k = len(best_clique)
+    lo = best_k
+    hi = min(N_VERTICES, degeneracy() + 1)
+    print(f"Greedy clique of size {lo}: {best_clique}")
+    print(f"Degeneracy bound: maximum clique size is in [{lo}, {hi}].")
+    print()
 
-        best_k = k
-        best_clique = clique_vertices
+    sat_name = f"{output_name}.next"
+    unsat_name = f"{output_name}.next-unsat"
+    prepared = {}  # k -> file already holding the CNF for k
+
+    def discard_prepared():
+        for name in prepared.values():
+            if os.path.exists(name):
+                os.remove(name)
+        prepared.clear()
+
+    proc = None  # solver still running, if any
+    try:
+        while lo < hi:
+            k = (lo + hi + 1) // 2
+            print_banner(k)
+
+            # Only adopt a prepared formula if it is really this probe, so
+            # that output_name always holds the last formula that was solved.
+            # A larger clique than asked for may have moved lo past the SAT
+            # successor.
+            if k in prepared:
+                os.replace(prepared.pop(k), output_name)
+            else:
+                cnf, nr_vars = encode_k_clique(k)
+                write_cnf_to_file(cnf, nr_vars, output_name)
+            discard_prepared()
+
+            proc = start_solver(output_name, solver_name, verbosity)
+
+            # Overlap with the solver run: prepare the probe that follows a
+            # SAT answer (lo = k) and the one that follows an UNSAT answer
+            # (hi = k - 1). Drop the array before waiting.
+            if k < hi:
+                prepared[(k + hi + 1) // 2] = sat_name
+            if lo < k - 1:
+                prepared[(lo + k) // 2] = unsat_name
+            for next_k, name in prepared.items():
+                cnf, nr_vars = encode_k_clique(next_k)
+                write_cnf_to_file(cnf, nr_vars, name)
+            cnf = None
+
+            result = wait_solver(proc)
+            proc = None
+            output_lines = solver_output_lines(result)
+            show_raw_output(output_lines)
+
+            rc = result.returncode
+
+            if rc == 20:
+                hi = k - 1
+                print(f"No clique of size {k}. Maximum clique size is in [{lo}, {hi}].")
+                print()
+                continue
 
-        print(f"SAT: clique of size {k} found. Vertices: {clique_vertices}")
-        print()
+            if rc != 10:
+                print(f"Solver returned unexpected code: {rc}")
+                break
 
-        stats_lines = extract_stats(result)
-        if stats_lines:
-            print("---------- Solver statistics (from Glucose) ----------")
-            for ln in stats_lines:
-                print(ln)
-            print("------------------------------------------------------")
+            model = parse_model(result)
+            clique_vertices = decode_clique(model)
+
+            # The model may select more than k vertices, which raises lo further.
+            best_k = len(clique_vertices)
+            best_clique = clique_vertices
+            lo = best_k
+
+            print(f"SAT: clique of size {best_k} found. Vertices: {clique_vertices}")
+            print()
+
+            stats_lines = extract_stats(output_lines)
+            if stats_lines:
+                print("---------- Solver statistics (from Glucose) ----------")
+                for ln in stats_lines:
+                    print(ln)
+                print("------------------------------------------------------")
+    except BaseException:
+        # Do not leave the solver running behind an error or Ctrl-C.
+        if proc is not None:
+            proc.kill()
+            proc.wait()
+        raise
+    finally:
+        discard_prepared()
 
     print()
     print("##################################################################")
@@ -413,7 +631,7 @@ def build_arg_parser():
         default=None,
         help=(
             "If set, solve only for a clique of this size k. "
-            "If omitted, search for a maximum clique by incrementing k."
+            "If omitted, search for a maximum clique by binary search on k."
         ),
     )
     parser.add_argument(